@@ -12,13 +12,20 @@ Requirements: Python 3.6+ and PHP installed on the system (CLI).
 Version: 0.9
 """
 
+import codecs
 import os
 import re
 import shutil
 import subprocess
 import sys
 import platform
-from typing import Optional, List, Set, Dict, Any
+import queue
+import socket
+import tempfile
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Set, Dict, Any, Tuple, Union
 
 # TOML parsing library (Python 3.11+ uses tomllib, older versions need toml package)
 try:
@@ -57,12 +64,63 @@ CONFIG_ENCODING: str = 'utf-8'
 # and remote URL access during rendering. Leave False to preserve original behavior.
 CONFIG_SAFE_MODE: bool = False
 
+# Converts internal .php links to .html in the generated HTML.
+# When disabled (and there are no [replace] entries), PHP output is saved without being decoded.
+CONFIG_CONVERT_LINKS: bool = True
+
+# Static files are hard-linked into the output folder instead of copied when it is on the
+# same filesystem (no data copied). CAUTION: the output files then share their content
+# with the sources: set to False if something modifies the output files in place.
+CONFIG_HARDLINK_STATIC: bool = True
+
+# Prints one line per processed file. When disabled, only errors and a progress counter
+# are shown while building. Can also be enabled with the '-v' / '--verbose' argument.
+CONFIG_VERBOSE: bool = False
+
 # Manual PHP path (if automatic detection fails). 
 # Leave None to try to detect.
 CONFIG_MANUAL_PHP_PATH: Optional[str] = None
 
+# Maximum number of files processed in parallel (PHP renders and static copies).
+# Leave None to use the number of CPU cores. Set to 1 to process one file at a time.
+CONFIG_MAX_WORKERS: Optional[int] = None
+
+# How PHP files are executed.
+# 'process': one PHP process per file (default, every page gets a fresh interpreter).
+# 'batch': each worker renders many files in a single PHP process, avoiding the interpreter
+#          startup per page. Pages then share PHP state (globals, functions, include_once),
+#          so only use it if your pages don't rely on a fresh interpreter.
+# 'worker': like 'batch', but each worker is a long-running PHP process that receives
+#           files over a UNIX socket (not available on Windows). Same caveats as 'batch'.
+CONFIG_RENDER_MODE: str = 'process'
+
 # SYSTEM LOGIC
 
+# Regex to match href, src, action, and data-* attributes (compiled once for all files)
+_LINK_PATTERN = re.compile(
+    r'((?:href|src|action|data-[\w-]+))\s*=\s*(["\'])([^"\'>]+)\2',
+    re.IGNORECASE
+)
+
+# Regex to match .php followed by a query string or an anchor
+_PHP_QS_PATTERN = re.compile(r'\.php([?#])', re.IGNORECASE)
+
+# Number of processed files between two writes of the log (verbose) or the progress counter
+LOG_EVERY: int = 50
+
+# Maximum size of a single os.write call when saving pages
+_WRITE_CHUNK_SIZE: int = 1 << 30
+
+# Substrings present in any attribute matched by _LINK_PATTERN (case-insensitive check)
+_LINK_ATTRIBUTE_HINTS = ('href', 'src', 'action', 'data-')
+
+# URL prefixes of external links and special protocols (never converted)
+_EXTERNAL_PREFIXES = ('http://', 'https://', 'mailto:', 'tel:', 'ftp://', '//', '#')
+
+# Compiled [replace] data (translate table and pattern), keyed by id() of the replacements
+# dict. Each entry keeps a reference to its dict so the id can't be reused.
+_REPL_CACHE: Dict[int, Tuple[Dict[str, str], Any, Any]] = {}
+
 def load_config_from_toml(root_dir: str) -> Dict[str, Any]:
     """
     Loads configuration from PHPStaticRender.toml file if it exists.
@@ -109,6 +167,8 @@ def apply_config_from_toml(toml_data: Dict[str, Any]):
     """
     global CONFIG_OUTPUT_FOLDER, CONFIG_IGNORE_PREFIX, CONFIG_PHP_EXTENSION
     global CONFIG_IGNORE_SYSTEM, CONFIG_ENCODING, CONFIG_SAFE_MODE, CONFIG_MANUAL_PHP_PATH
+    global CONFIG_MAX_WORKERS, CONFIG_RENDER_MODE, CONFIG_CONVERT_LINKS, CONFIG_VERBOSE
+    global CONFIG_HARDLINK_STATIC
     
     config = toml_data.get('config', {})
     
@@ -127,19 +187,40 @@ def apply_config_from_toml(toml_data: Dict[str, Any]):
     if 'safe_mode' in config:
         CONFIG_SAFE_MODE = config['safe_mode']
     
+    if 'convert_links' in config:
+        CONFIG_CONVERT_LINKS = config['convert_links']
+    
     if 'manual_php_path' in config and config['manual_php_path']:
         CONFIG_MANUAL_PHP_PATH = config['manual_php_path']
     
+    if 'max_workers' in config and config['max_workers']:
+        CONFIG_MAX_WORKERS = int(config['max_workers'])
+    
+    if 'render_mode' in config:
+        CONFIG_RENDER_MODE = config['render_mode']
+    
+    if 'verbose' in config:
+        CONFIG_VERBOSE = config['verbose']
+    
+    if 'hardlink_static' in config:
+        CONFIG_HARDLINK_STATIC = config['hardlink_static']
+    
+    ignore_system = set(CONFIG_IGNORE_SYSTEM)
     if 'ignore_system' in config:
         # Merge with default ignore list
-        CONFIG_IGNORE_SYSTEM.update(config['ignore_system'])
-        # Always ignore the output folder
-        CONFIG_IGNORE_SYSTEM.add(CONFIG_OUTPUT_FOLDER)
+        ignore_system.update(config['ignore_system'])
+    # Always ignore the output folder
+    ignore_system.add(CONFIG_OUTPUT_FOLDER)
+    # Frozen for the build: the scan only does membership tests on it
+    CONFIG_IGNORE_SYSTEM = frozenset(ignore_system)
 
 def apply_replacements(html_content: str, replacements: Dict[str, str]) -> str:
     """
     Applies text replacements defined in TOML [replace] section.
     
+    All patterns are searched in a single pass over the HTML. Where patterns overlap,
+    the longest one wins, and replaced text is not searched again.
+    
     Args:
         html_content (str): HTML content to process.
         replacements (Dict[str, str]): Dictionary of search -> replace patterns.
@@ -150,11 +231,59 @@ def apply_replacements(html_content: str, replacements: Dict[str, str]) -> str:
     if not replacements:
         return html_content
     
-    result = html_content
-    for search_pattern, replacement_text in replacements.items():
-        result = result.replace(search_pattern, replacement_text)
+    trans_table, pattern = _compile_replacements(replacements)
+    
+    # One scan of the HTML for all multi-character patterns
+    if pattern is not None:
+        html_content = pattern.sub(lambda match: replacements[match.group(0)], html_content)
+    
+    # Single-character swaps, all at once
+    if trans_table:
+        html_content = html_content.translate(trans_table)
+    
+    return html_content
+
+def _compile_replacements(replacements: Dict[str, str]) -> Tuple[Any, Any]:
+    """
+    Compiles (once per dict) the patterns used to apply replacements.
+    
+    Single-character swaps (e.g. smart quotes) go to a str.translate table, applied
+    after the patterns. A swap whose character appears in another replacement text
+    stays in the pattern, so replaced text is never replaced again.
+    
+    Args:
+        replacements (Dict[str, str]): Dictionary of search -> replace patterns.
+    
+    Returns:
+        Tuple[Any, Any]: The translate table (or None) and the replacements pattern
+                         (None without other keys).
+    """
+    cached = _REPL_CACHE.get(id(replacements))
+    if cached is None or cached[0] is not replacements:
+        keys = [key for key in replacements if key]
+        singles = {
+            key: value for key, value in replacements.items()
+            if len(key) == 1 and isinstance(value, str) and len(value) == 1
+        }
+        
+        # Moves back to the pattern the swaps that would touch other replacement texts
+        moved = True
+        while moved:
+            other_texts = ''.join(str(replacements[key]) for key in keys if key not in singles)
+            moved = False
+            for key in list(singles):
+                if key in other_texts:
+                    del singles[key]
+                    moved = True
+        
+        # Single alternation, longest patterns first so overlapping keys keep the longest match
+        multi_keys = sorted((key for key in keys if key not in singles), key=len, reverse=True)
+        pattern = re.compile('|'.join(re.escape(key) for key in multi_keys)) if multi_keys else None
+        trans_table = str.maketrans(singles) if singles else None
+        cached = (replacements, trans_table, pattern)
+        _REPL_CACHE[id(replacements)] = cached
     
-    return result
+    return cached[1], cached[2]
 
 def configure_console_encoding():
     """
@@ -167,7 +296,6 @@ def configure_console_encoding():
             sys.stderr.reconfigure(encoding='utf-8')
         except AttributeError:
             # Fallback for older versions
-            import codecs
             sys.stdout = codecs.getwriter("utf-8")(sys.stdout.detach())
             sys.stderr = codecs.getwriter("utf-8")(sys.stderr.detach())
         except Exception:
@@ -216,82 +344,581 @@ def convert_internal_php_links(html_content: str) -> str:
     Returns:
         str: HTML content with converted links.
     """
-    # Pattern to match links in common HTML attributes (href, src, action, data-*)
-    # Only converts if the link:
-    # 1. Ends with .php (case-insensitive)
-    # 2. Is not an external URL (doesn't start with http://, https://, mailto:, tel:, ftp://, //)
-    # 3. Is not a PHP variable or template tag
+    # Cheap substring tests first: nothing to convert without .php and a link attribute
+    if not _may_have_php_links(html_content):
+        return html_content
     
-    def replace_link(match):
-        attr_name = match.group(1)
-        quote = match.group(2)
-        url = match.group(3)
-        
-        # Skip external URLs and special protocols
-        if url.startswith(('http://', 'https://', 'mailto:', 'tel:', 'ftp://', '//', '#')):
-            return match.group(0)
-        
-        # Skip PHP variables and template tags
-        if '<?php' in url or '<?=' in url or '{' in url or '$' in url:
-            return match.group(0)
-        
-        # Convert .php to .html (case-insensitive)
-        if url.lower().endswith('.php'):
-            converted_url = url[:-4] + '.html'
-            return f'{attr_name}={quote}{converted_url}{quote}'
-        
-        # Also handle .php with query strings or anchors
-        php_pattern = re.compile(r'\.php([?#])', re.IGNORECASE)
-        if php_pattern.search(url):
-            converted_url = php_pattern.sub(r'.html\1', url)
-            return f'{attr_name}={quote}{converted_url}{quote}'
-        
+    return _LINK_PATTERN.sub(_replace_link, html_content)
+
+def _may_have_php_links(html_content: str) -> bool:
+    """
+    Tells whether the HTML may contain a link to convert, using only substring tests.
+
+    The link regex only matches '.php' inside href, src, action or data-* attributes,
+    so content without both (RSS, JSON, plain text...) can skip it.
+
+    Args:
+        html_content (str): The HTML content to check.
+
+    Returns:
+        bool: False if the link regex certainly has nothing to convert.
+    """
+    lowered = html_content.lower()
+    return '.php' in lowered and any(hint in lowered for hint in _LINK_ATTRIBUTE_HINTS)
+
+def _replace_link(match) -> str:
+    """
+    Replacement callback of convert_internal_php_links for a single attribute match.
+
+    Only converts if the link:
+    1. Ends with .php (case-insensitive), optionally followed by a query string or anchor
+    2. Is not an external URL (doesn't start with http://, https://, mailto:, tel:, ftp://, //)
+    3. Is not a PHP variable or template tag
+    """
+    attr_name = match.group(1)
+    quote = match.group(2)
+    url = match.group(3)
+    
+    # Skip external URLs and special protocols
+    if url.startswith(_EXTERNAL_PREFIXES):
         return match.group(0)
     
-    # Regex to match href, src, action, and data-* attributes
-    pattern = re.compile(
-        r'((?:href|src|action|data-[\w-]+))\s*=\s*(["\'])([^"\'>]+)\2',
-        re.IGNORECASE
-    )
+    # Skip PHP variables and template tags
+    if '<?php' in url or '<?=' in url or '{' in url or '$' in url:
+        return match.group(0)
     
-    return pattern.sub(replace_link, html_content)
+    # Convert .php to .html (case-insensitive)
+    if url.lower().endswith('.php'):
+        converted_url = url[:-4] + '.html'
+        return f'{attr_name}={quote}{converted_url}{quote}'
+    
+    # Also handle .php with query strings or anchors
+    if _PHP_QS_PATTERN.search(url):
+        converted_url = _PHP_QS_PATTERN.sub(r'.html\1', url)
+        return f'{attr_name}={quote}{converted_url}{quote}'
+    
+    return match.group(0)
 
-def render_php_file(php_exec: str, src_path: str, cwd: str) -> str:
+def render_php_file(php_argv: Tuple[str, ...], src_path: str, cwd: str, decode: bool = True) -> Union[str, bytes]:
     """
     Executes a PHP file and captures its output (stdout).
 
     Args:
-        php_exec (str): Path to the PHP executable.
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
         src_path (str): Absolute path of the PHP file to be processed.
         cwd (str): Project root directory (so includes work).
+        decode (bool): When False, the raw output bytes are returned.
 
     Returns:
-        str: The generated HTML code.
+        Union[str, bytes]: The generated HTML code (bytes when decode is False).
 
     Raises:
-        subprocess.CalledProcessError: If PHP returns a fatal error.
+        subprocess.CalledProcessError: If PHP returns a fatal error (stderr as bytes).
     """
     # Executes PHP. 
     # check=True raises exception if PHP errors (exit code != 0)
-    php_args: List[str] = [php_exec]
+    result = subprocess.run(
+        (*php_argv, src_path),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd, 
+        check=True
+    )
+    if not decode:
+        return result.stdout
+
+    # Decoded once as a whole, replacing invalid characters instead of crashing
+    return result.stdout.decode(CONFIG_ENCODING, 'replace')
+
+def php_argv_base(php_exec: str, opcache_dir: str) -> Tuple[str, ...]:
+    """
+    Returns the PHP command line prefix (executable and '-d' options).
+
+    Built once per build, after the configuration is loaded, and passed down
+    to every PHP invocation.
+
+    Args:
+        php_exec (str): Path to the PHP executable.
+        opcache_dir (str): Existing folder for the opcache file cache (see php_ini_args).
+
+    Returns:
+        Tuple[str, ...]: Command line prefix, to be followed by the script arguments.
+    """
+    return (php_exec, *php_ini_args(opcache_dir))
+
+def php_ini_args(opcache_dir: str) -> List[str]:
+    """
+    Returns the PHP CLI '-d' options shared by every PHP invocation.
+
+    Opcache is enabled with a file cache in opcache_dir, so each PHP process
+    reuses the bytecode compiled by previous ones (ignored if opcache isn't installed).
+    Timestamps aren't validated since sources don't change during a build.
+
+    Args:
+        opcache_dir (str): Folder of the opcache file cache. It must be private to
+                           the build, since PHP loads the compiled scripts found there.
+
+    Returns:
+        List[str]: Command line options.
+    """
+    args = [
+        '-d', 'opcache.enable_cli=1',
+        '-d', 'opcache.file_cache=' + opcache_dir,
+        '-d', 'opcache.file_cache_only=1',
+        '-d', 'opcache.validate_timestamps=0'
+    ]
     if CONFIG_SAFE_MODE:
-        php_args.extend([
+        args.extend([
             '-d', 'disable_functions=exec,system,shell_exec,passthru,proc_open,popen',
             '-d', 'allow_url_fopen=0',
             '-d', 'allow_url_include=0'
         ])
-    php_args.append(src_path)
+    return args
+
+# Driver script used by the 'batch' render mode. It reads one file path per line from
+# stdin, includes it and surrounds its output with markers (the marker is given in argv).
+# The script path variables are set as if PHP had been started on each file.
+BATCH_BOOTSTRAP_PHP: str = r'''<?php
+$__psr_marker = $argv[1];
+while (($__psr_file = fgets(STDIN)) !== false) {
+    $__psr_file = rtrim($__psr_file, "\r\n");
+    if ($__psr_file === '') {
+        continue;
+    }
+    $_SERVER['PHP_SELF'] = $_SERVER['SCRIPT_NAME'] = $__psr_file;
+    $_SERVER['SCRIPT_FILENAME'] = $_SERVER['PATH_TRANSLATED'] = $__psr_file;
+    $argv = $_SERVER['argv'] = array($__psr_file);
+    $argc = $_SERVER['argc'] = 1;
+    echo $__psr_marker, ":BEGIN\n";
+    include $__psr_file;
+    echo "\n", $__psr_marker, ":END\n";
+}
+'''
 
+def render_php_batch(php_argv: Tuple[str, ...], src_paths: List[str], cwd: str, bootstrap_path: str) -> List[str]:
+    """
+    Executes several PHP files in a single PHP process through the batch bootstrap script.
+
+    The files are rendered in order. If PHP stops before the end (fatal error, exit()),
+    only the outputs of the files completed so far are returned.
+
+    Args:
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
+        src_paths (List[str]): Absolute paths of the PHP files to be processed.
+        cwd (str): Project root directory (so includes work).
+        bootstrap_path (str): Path of the file containing BATCH_BOOTSTRAP_PHP.
+
+    Returns:
+        List[str]: The generated HTML code of the first completed files.
+    """
+    marker = 'PSR-' + uuid.uuid4().hex
+    php_args = (*php_argv, bootstrap_path, marker)
+    paths_input = b''.join(os.fsencode(path) + b'\n' for path in src_paths)
+
+    # No check=True: a failing file is detected by its missing END marker
     result = subprocess.run(
         php_args,
-        capture_output=True,
-        text=True,
-        cwd=cwd, 
-        check=True,
-        encoding=CONFIG_ENCODING,
-        errors='replace' # Replaces invalid characters instead of crashing
+        input=paths_input,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=cwd
     )
-    return result.stdout
+
+    begin_marker = (marker + ':BEGIN\n').encode('ascii')
+    end_marker = ('\n' + marker + ':END\n').encode('ascii')
+    stdout = result.stdout
+    outputs: List[str] = []
+    pos = 0
+    while len(outputs) < len(src_paths):
+        begin = stdout.find(begin_marker, pos)
+        if begin < 0:
+            break
+        start = begin + len(begin_marker)
+        end = stdout.find(end_marker, start)
+        if end < 0:
+            break
+        outputs.append(stdout[start:end].decode(CONFIG_ENCODING, 'replace'))
+        pos = end + len(end_marker)
+
+    return outputs
+
+# Long-running PHP worker used by the 'worker' render mode. It listens on the UNIX socket
+# given in argv; each connection sends one file path and receives "<length>\n<output>".
+# The script path variables are set as if PHP had been started on each file.
+WORKER_PHP: str = r'''<?php
+$__psr_server = stream_socket_server('unix://' . $argv[1], $__psr_errno, $__psr_errstr);
+if ($__psr_server === false) {
+    fwrite(STDERR, $__psr_errstr . "\n");
+    exit(1);
+}
+while ($__psr_conn = stream_socket_accept($__psr_server, -1)) {
+    $__psr_file = rtrim((string) fgets($__psr_conn), "\r\n");
+    $_SERVER['PHP_SELF'] = $_SERVER['SCRIPT_NAME'] = $__psr_file;
+    $_SERVER['SCRIPT_FILENAME'] = $_SERVER['PATH_TRANSLATED'] = $__psr_file;
+    $argv = $_SERVER['argv'] = array($__psr_file);
+    $argc = $_SERVER['argc'] = 1;
+    $__psr_level = ob_get_level();
+    ob_start();
+    include $__psr_file;
+    // Closes buffers left open by the page so its whole output is captured
+    while (ob_get_level() > $__psr_level + 1) {
+        ob_end_flush();
+    }
+    $__psr_data = ob_get_clean();
+    $__psr_data = strlen($__psr_data) . "\n" . $__psr_data;
+    while ($__psr_data !== '' && ($__psr_written = fwrite($__psr_conn, $__psr_data)) > 0) {
+        $__psr_data = substr($__psr_data, $__psr_written);
+    }
+    fclose($__psr_conn);
+}
+'''
+
+def start_php_worker(php_argv: Tuple[str, ...], cwd: str, worker_path: str, socket_path: str) -> subprocess.Popen:
+    """
+    Starts a long-running PHP worker listening on a UNIX socket.
+
+    Args:
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
+        cwd (str): Project root directory (so includes work).
+        worker_path (str): Path of the file containing WORKER_PHP.
+        socket_path (str): Path of the UNIX socket the worker listens on.
+
+    Returns:
+        subprocess.Popen: The worker process (use wait_php_worker before sending files).
+    """
+    if os.path.exists(socket_path):
+        os.remove(socket_path)
+
+    return subprocess.Popen(
+        (*php_argv, worker_path, socket_path),
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=cwd
+    )
+
+def wait_php_worker(process: subprocess.Popen, socket_path: str, timeout: float = 10.0):
+    """
+    Waits until a PHP worker has created its socket.
+
+    Args:
+        process (subprocess.Popen): The worker process.
+        socket_path (str): Path of the UNIX socket the worker listens on.
+        timeout (float): Maximum time to wait, in seconds.
+
+    Raises:
+        OSError: If the worker exits or doesn't start in time (it is killed).
+    """
+    deadline = time.monotonic() + timeout
+    while not os.path.exists(socket_path):
+        if process.poll() is not None or time.monotonic() > deadline:
+            process.kill()
+            process.wait()
+            raise OSError("PHP worker failed to start")
+        time.sleep(0.01)
+
+def render_php_worker(socket_path: str, src_path: str) -> str:
+    """
+    Renders a PHP file through a running PHP worker.
+
+    Args:
+        socket_path (str): Path of the UNIX socket the worker listens on.
+        src_path (str): Absolute path of the PHP file to be processed.
+
+    Returns:
+        str: The generated HTML code.
+
+    Raises:
+        OSError: If the worker can't be reached or doesn't send a complete answer
+                 (e.g. it died on a fatal error or exit() in the page).
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        # The socket file exists slightly before the worker starts listening
+        for attempt in range(100):
+            try:
+                sock.connect(socket_path)
+                break
+            except ConnectionRefusedError:
+                if attempt == 99:
+                    raise
+                time.sleep(0.01)
+
+        sock.sendall(os.fsencode(src_path) + b'\n')
+        with sock.makefile('rb') as stream:
+            header = stream.readline()
+            try:
+                size = int(header)
+            except ValueError:
+                raise OSError("Incomplete answer from PHP worker")
+            data = stream.read(size)
+            if len(data) != size:
+                raise OSError("Incomplete answer from PHP worker")
+    finally:
+        sock.close()
+
+    return data.decode(CONFIG_ENCODING, 'replace')
+
+def _save_html(html_content: str, dest_html_path: str, replacements: Dict[str, str]):
+    """
+    Post-processes rendered PHP output and writes it to the destination .html file.
+
+    Args:
+        html_content (str): Output of the PHP file.
+        dest_html_path (str): Destination .html path.
+        replacements (Dict[str, str]): Replacements from the TOML [replace] section.
+
+    Raises:
+        OSError: If the output file cannot be written.
+    """
+    # Convert internal .php links to .html
+    if CONFIG_CONVERT_LINKS:
+        html_content = convert_internal_php_links(html_content)
+
+    # Apply replacements from TOML configuration
+    html_content = apply_replacements(html_content, replacements)
+
+    _write_bytes(dest_html_path, html_content.encode('utf-8', 'replace'))
+
+def _write_bytes(path: str, data: bytes):
+    """
+    Writes data to a file with unbuffered os.write calls (a single one for most pages).
+
+    Args:
+        path (str): Destination file path (created or truncated).
+        data (bytes): Content to write.
+
+    Raises:
+        OSError: If the file cannot be written.
+    """
+    _unlink_existing(path)
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, 'O_BINARY', 0), 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            # Chunked: some kernels cap a single write below 2 GiB; it may also be partial
+            written = os.write(fd, view[:_WRITE_CHUNK_SIZE])
+            view = view[written:]
+    finally:
+        os.close(fd)
+
+def _render_one(php_argv: Tuple[str, ...], cwd: str, task: Tuple[str, str, str], replacements: Dict[str, str]):
+    """
+    Renders a single PHP file and saves the post-processed HTML.
+
+    Args:
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
+        cwd (str): Project root directory (so includes work).
+        task (Tuple[str, str, str]): Source path, destination .html path and relative path.
+        replacements (Dict[str, str]): Replacements from the TOML [replace] section.
+
+    Raises:
+        subprocess.CalledProcessError: If PHP returns a fatal error.
+        OSError: If the output file cannot be written.
+    """
+    src_path, dest_html_path, _ = task
+
+    # Without post-processing, valid UTF-8 output is saved as is, without the text
+    # round trip. The page file is only created once PHP has succeeded.
+    if not CONFIG_CONVERT_LINKS and not replacements and codecs.lookup(CONFIG_ENCODING).name == 'utf-8':
+        output = render_php_file(php_argv, src_path, cwd, decode=False)
+        try:
+            output.decode('utf-8')
+        except UnicodeDecodeError:
+            # Invalid bytes are replaced, as when the output is decoded
+            output = output.decode('utf-8', 'replace').encode('utf-8')
+        _write_bytes(dest_html_path, output)
+        return
+
+    html_content = render_php_file(php_argv, src_path, cwd)
+    _save_html(html_content, dest_html_path, replacements)
+
+def _render_batch(
+    php_argv: Tuple[str, ...],
+    cwd: str,
+    tasks: List[Tuple[str, str, str]],
+    replacements: Dict[str, str],
+    bootstrap_path: str
+) -> List[Tuple[Tuple[str, str, str], Optional[Exception]]]:
+    """
+    Renders a group of PHP files with render_php_batch and saves the post-processed HTML.
+
+    When a file stops the batch, it is rendered again on its own with render_php_file
+    (which reports its real error) and the batch resumes with the following files,
+    so one bad PHP file doesn't affect the others.
+
+    Args:
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
+        cwd (str): Project root directory (so includes work).
+        tasks (List[Tuple[str, str, str]]): Source path, destination .html path and relative path.
+        replacements (Dict[str, str]): Replacements from the TOML [replace] section.
+        bootstrap_path (str): Path of the file containing BATCH_BOOTSTRAP_PHP.
+
+    Returns:
+        List[Tuple[Tuple[str, str, str], Optional[Exception]]]: Each task with the error
+        raised while processing it (None on success).
+    """
+    results: List[Tuple[Tuple[str, str, str], Optional[Exception]]] = []
+    pending = list(tasks)
+
+    while pending:
+        try:
+            outputs = render_php_batch(php_argv, [task[0] for task in pending], cwd, bootstrap_path)
+        except OSError:
+            outputs = []
+
+        for task, html_content in zip(pending, outputs):
+            try:
+                _save_html(html_content, task[1], replacements)
+                results.append((task, None))
+            except Exception as ex:
+                results.append((task, ex))
+        pending = pending[len(outputs):]
+
+        if pending:
+            # Fallback: the first pending file stopped the batch, runs it in its own process
+            task = pending.pop(0)
+            try:
+                _render_one(php_argv, cwd, task, replacements)
+                results.append((task, None))
+            except Exception as ex:
+                results.append((task, ex))
+
+    return results
+
+def _render_worker(
+    php_argv: Tuple[str, ...],
+    cwd: str,
+    task: Tuple[str, str, str],
+    replacements: Dict[str, str],
+    workers: queue.Queue,
+    worker_path: str
+):
+    """
+    Renders a single PHP file with a free PHP worker and saves the post-processed HTML.
+
+    If the worker fails, it is restarted when it died, and the file is rendered again
+    on its own with render_php_file (which reports its real error).
+
+    Args:
+        php_argv (Tuple[str, ...]): PHP command line prefix, from php_argv_base.
+        cwd (str): Project root directory (so includes work).
+        task (Tuple[str, str, str]): Source path, destination .html path and relative path.
+        replacements (Dict[str, str]): Replacements from the TOML [replace] section.
+        workers (queue.Queue): Free workers, as {'process': Popen or None, 'socket_path': str}.
+        worker_path (str): Path of the file containing WORKER_PHP.
+
+    Raises:
+        subprocess.CalledProcessError: If PHP returns a fatal error.
+        OSError: If the output file cannot be written.
+    """
+    html_content = None
+    worker = workers.get()
+    try:
+        if worker['process'] is not None:
+            try:
+                html_content = render_php_worker(worker['socket_path'], task[0])
+            except OSError:
+                try:
+                    # The connection drops slightly before the process ends
+                    worker['process'].wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    pass
+                if worker['process'].poll() is not None:
+                    # The worker died (fatal error, exit()): replaces it for the next files
+                    try:
+                        worker['process'] = start_php_worker(php_argv, cwd, worker_path, worker['socket_path'])
+                        wait_php_worker(worker['process'], worker['socket_path'])
+                    except OSError:
+                        worker['process'] = None
+    finally:
+        workers.put(worker)
+
+    if html_content is None:
+        # Fallback: runs the file in its own process
+        _render_one(php_argv, cwd, task, replacements)
+    else:
+        _save_html(html_content, task[1], replacements)
+
+def _copy_one(task: Tuple[str, str, str], hardlink: bool = False):
+    """
+    Copies a single static file to the destination folder.
+
+    Args:
+        task (Tuple[str, str, str]): Source path, destination path and relative path.
+        hardlink (bool): Tries a hard link first (no data copied), falling back to a copy.
+
+    Raises:
+        OSError: If the file cannot be copied.
+    """
+    src_path, dest_path, _ = task
+    if hardlink:
+        _unlink_existing(dest_path)
+        try:
+            os.link(src_path, dest_path)
+            return
+        except OSError:
+            # e.g. filesystem without hard links or not allowed: copies instead
+            pass
+    _fast_copy(src_path, dest_path)
+
+def _unlink_existing(path: str):
+    """
+    Removes the file at a destination path, if any, before it is written.
+
+    A file left there may be a hard link to a source file (see CONFIG_HARDLINK_STATIC):
+    writing through it would modify the source, so a new file is always created.
+
+    Args:
+        path (str): Destination file path.
+
+    Raises:
+        OSError: If an existing file cannot be removed.
+    """
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+def _fast_copy(src_path: str, dest_path: str):
+    """
+    Copies a file preserving its metadata (like shutil.copy2).
+
+    On Linux, the data is copied by the kernel with os.copy_file_range, without
+    passing through Python. Elsewhere (or if the kernel refuses), shutil.copyfile
+    is used, which already picks the fastest method available on the platform.
+
+    Args:
+        src_path (str): Source file path.
+        dest_path (str): Destination file path.
+
+    Raises:
+        OSError: If the file cannot be copied.
+    """
+    # A file left at the destination may be a hard link to the source: truncating
+    # it would empty the source, so the copy always goes to a new file
+    _unlink_existing(dest_path)
+
+    copied = False
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src_path, 'rb') as fsrc, open(dest_path, 'wb') as fdst:
+                # Loops on the remaining size: a single call may copy less than requested
+                remaining = os.fstat(fsrc.fileno()).st_size
+                while remaining > 0:
+                    count = os.copy_file_range(fsrc.fileno(), fdst.fileno(), min(remaining, 1 << 30))
+                    if not count:
+                        break
+                    remaining -= count
+            # Some filesystems (FUSE, virtual) return 0 right away: copied short, copies again
+            copied = remaining <= 0
+        except OSError:
+            # e.g. unsupported filesystem or kernel: falls back to the portable copy
+            pass
+
+    if not copied:
+        shutil.copyfile(src_path, dest_path)
+    shutil.copystat(src_path, dest_path)
 
 def build_static_site():
     """
@@ -299,7 +926,7 @@ def build_static_site():
     1. Loads configuration from PHPStaticRender.toml (if exists).
     2. Prepares directories.
     3. Scans files recursively.
-    4. Processes PHP or copies static files.
+    4. Processes PHP or copies static files (in parallel).
     5. Applies replacements from TOML.
     6. Generates final report.
     """
@@ -351,81 +978,288 @@ def build_static_site():
     # --- Counters for statistics ---
     stats = {'php': 0, 'static': 0, 'ignored': 0, 'errors': 0}
 
-    # --- Processing Loop ---
-    for current_root, dirs, files in os.walk(root_dir, followlinks=False):
-        # Filters ignored folders in-place
-        filtered_dirs = []
-        for d in dirs:
-            if d in CONFIG_IGNORE_SYSTEM or d.startswith('.'):
+    # --- Scanning ---
+    # Each task is a (source path, destination path, relative path) tuple
+    php_tasks: List[Tuple[str, str, str]] = []
+    static_tasks: List[Tuple[str, str, str]] = []
+
+    # Name checks precomputed for the scan: a single startswith() covers hidden entries
+    # and the ignore prefix, and only the end of each name is lowercased for the extension
+    skip_prefixes = (CONFIG_IGNORE_PREFIX, '.')
+    php_ext = CONFIG_PHP_EXTENSION.lower()
+    php_ext_len = len(php_ext)
+
+    # Identity of the output folder, so the scan never descends into it whatever its name
+    dist_stat = os.stat(dist_dir)
+    dist_key = (dist_stat.st_dev, dist_stat.st_ino)
+
+    # Hard links only work within a filesystem
+    hardlink_static = CONFIG_HARDLINK_STATIC and os.stat(root_dir).st_dev == dist_stat.st_dev
+
+    # Destination folders already created, so os.makedirs runs once per folder
+    created_dirs: Set[str] = {dist_dir}
+
+    def _ensure_dir(dir_path: str):
+        """
+        Creates a destination folder (and its parents) unless it was already created.
+        """
+        if dir_path not in created_dirs:
+            os.makedirs(dir_path, exist_ok=True)
+            created_dirs.add(dir_path)
+
+    def _scan(dir_path: str, rel_prefix: str):
+        """
+        Recursively scans a directory with os.scandir, collecting PHP and static
+        file tasks. DirEntry type checks reuse the cached readdir data,
+        avoiding extra stat calls per entry.
+
+        Args:
+            dir_path (str): Absolute path of the directory being scanned.
+            rel_prefix (str): Path of dir_path relative to the project root,
+                              ending with os.sep (empty for the root itself).
+        """
+        # Entries are collected first so the directory handle is released before recursing
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError as e:
+            # Unreadable folder (e.g. no permission): skipped, the build carries on
+            print(f"WARNING: Skipping unreadable folder '{rel_prefix[:-1] or '.'}' ({e.strerror})")
+            stats['ignored'] += 1
+            return
+
+        # Destination folder of this directory, joined once for all its files
+        dest_dir = dist_dir + os.sep + rel_prefix[:-1] if rel_prefix else dist_dir
+        dest_prefix = dest_dir + os.sep
+
+        for entry in entries:
+            name = entry.name
+
+            # Skips ignored system entries and hidden files/folders
+            if name in CONFIG_IGNORE_SYSTEM:
                 continue
-            dir_path = os.path.join(current_root, d)
-            if os.path.islink(dir_path):
+            skip_prefixed = name.startswith(skip_prefixes)
+            if skip_prefixed and name[:1] == '.':
+                continue
+
+            # Skips symbolic links to avoid external traversal
+            if entry.is_symlink():
                 stats['ignored'] += 1
                 continue
-            filtered_dirs.append(d)
-        dirs[:] = filtered_dirs
 
-        for file in files:
-            # Skips the script itself and hidden files
-            if file == script_filename or file in CONFIG_IGNORE_SYSTEM or file.startswith('.'):
+            if entry.is_dir(follow_symlinks=False):
+                # Inode first: it comes from the cached dirent on POSIX, while stat() needs a call
+                if entry.inode() == dist_key[1] and entry.stat(follow_symlinks=False).st_dev == dist_key[0]:
+                    continue
+                _scan(entry.path, rel_prefix + name + os.sep)
                 continue
 
-            # Checks ignore prefix (e.g., __header.php)
-            if file.startswith(CONFIG_IGNORE_PREFIX):
-                stats['ignored'] += 1
+            if not entry.is_file(follow_symlinks=False):
                 continue
 
-            # Skips symbolic links to avoid external traversal
-            if os.path.islink(os.path.join(current_root, file)):
+            # Skips the script itself
+            if name == script_filename:
+                continue
+
+            # Checks ignore prefix (e.g., __header.php), which only applies to files
+            if skip_prefixed:
                 stats['ignored'] += 1
                 continue
-            
-            # Paths
-            src_file_path = os.path.join(current_root, file)
-            rel_path = os.path.relpath(src_file_path, root_dir)
-            dest_file_path = os.path.join(dist_dir, rel_path)
-            
-            # Creates subfolders in destination
-            os.makedirs(os.path.dirname(dest_file_path), exist_ok=True)
 
-            # Processing
-            if file.lower().endswith(CONFIG_PHP_EXTENSION):
+            # Paths, built by concatenation on the prefixes of the current directory
+            src_file_path = entry.path
+            rel_path = rel_prefix + name
+            dest_file_path = dest_prefix + name
+
+            # Creates subfolders in destination (before dispatching, so workers never race on it)
+            _ensure_dir(dest_dir)
+
+            if php_ext_len and name[-php_ext_len:].lower() == php_ext:
                 # PHP case: Executes and Saves .html
-                dest_html_path = os.path.splitext(dest_file_path)[0] + '.html'
-                
-                try:
-                    html_content = render_php_file(php_exec, src_file_path, root_dir)
-                    
-                    # Convert internal .php links to .html
-                    html_content = convert_internal_php_links(html_content)
-                    
-                    # Apply replacements from TOML configuration
-                    html_content = apply_replacements(html_content, replacements)
-                    
-                    with open(dest_html_path, 'w', encoding='utf-8') as f:
-                        f.write(html_content)
-                    
-                    print(f"[PHP] {rel_path} -> .html")
-                    stats['php'] += 1
-
-                except subprocess.CalledProcessError as e:
-                    print(f"[PHP ERROR] {rel_path}")
-                    # Displays only the last lines of the error for easier reading
-                    err_msg = e.stderr.strip().split('\n')[-5:]
-                    print("   └── " + "\n   └── ".join(err_msg))
-                    stats['errors'] += 1
-                except Exception as ex:
-                    print(f"[IO ERROR] {rel_path}: {ex}")
-                    stats['errors'] += 1
+                dest_html_path = dest_prefix + os.path.splitext(name)[0] + '.html'
+                php_tasks.append((src_file_path, dest_html_path, rel_path))
             else:
                 # Static case: Simple copy
+                static_tasks.append((src_file_path, dest_file_path, rel_path))
+
+    _scan(root_dir, '')
+
+    # A static file can't share its destination with a rendered page (e.g. 'page.html'
+    # next to 'page.php'): the page wins and the static file is reported and skipped
+    page_paths = {os.path.normcase(task[1]) for task in php_tasks}
+    if page_paths:
+        colliding = [task for task in static_tasks if os.path.normcase(task[1]) in page_paths]
+        for task in colliding:
+            print(f"WARNING: Skipping '{task[2]}': the same output file is rendered from a PHP file")
+            stats['ignored'] += 1
+        if colliding:
+            static_tasks = [task for task in static_tasks if os.path.normcase(task[1]) not in page_paths]
+
+    # --- Output ---
+    # Per-file lines are buffered and written every LOG_EVERY files (verbose), otherwise
+    # a single progress line is rewritten on terminals. Errors are always printed at once.
+    verbose = CONFIG_VERBOSE or any(arg in ('-v', '--verbose') for arg in sys.argv[1:])
+    show_progress = not verbose and sys.stdout.isatty()
+    total_tasks = len(php_tasks) + len(static_tasks)
+    log_buffer: List[str] = []
+    progress = {'done': 0, 'shown': False}
+
+    def _flush_output():
+        """
+        Writes the buffered log lines and ends the progress line.
+        """
+        if log_buffer:
+            sys.stdout.write('\n'.join(log_buffer) + '\n')
+            log_buffer.clear()
+        if progress['shown']:
+            sys.stdout.write('\n')
+            progress['shown'] = False
+        sys.stdout.flush()
+
+    def _log(line: str):
+        """
+        Buffers a per-file line (verbose only).
+        """
+        if verbose:
+            log_buffer.append(line)
+            if len(log_buffer) >= LOG_EVERY:
+                _flush_output()
+
+    def _log_error(line: str):
+        """
+        Prints an error line right away, after the pending output.
+        """
+        _flush_output()
+        print(line)
+
+    # --- Processing ---
+    def _report(kind: str, task: Tuple[str, str, str], error: Optional[Exception]):
+        """
+        Prints the result of a task and updates the statistics.
+        """
+        rel_path = task[2]
+
+        if error is None:
+            if kind == 'static':
+                _log(f"[COPY] {rel_path}")
+                stats['static'] += 1
+            else:
+                _log(f"[PHP] {rel_path} -> .html")
+                stats['php'] += 1
+        elif isinstance(error, subprocess.CalledProcessError):
+            # Displays only the last lines of the error for easier reading
+            stderr = error.stderr.decode(CONFIG_ENCODING, 'replace') if error.stderr else ''
+            err_msg = stderr.strip().split('\n')[-5:]
+            _log_error(f"[PHP ERROR] {rel_path}\n   └── " + "\n   └── ".join(err_msg))
+            stats['errors'] += 1
+        else:
+            if kind == 'static':
+                _log_error(f"[COPY ERROR] {rel_path}: {error}")
+            else:
+                _log_error(f"[IO ERROR] {rel_path}: {error}")
+            stats['errors'] += 1
+
+        progress['done'] += 1
+        if show_progress and (progress['done'] % LOG_EVERY == 0 or progress['done'] == total_tasks):
+            sys.stdout.write(f"\rProcessed {progress['done']}/{total_tasks} files")
+            sys.stdout.flush()
+            progress['shown'] = True
+
+    render_mode = CONFIG_RENDER_MODE
+    if render_mode not in ('process', 'batch', 'worker'):
+        print(f"WARNING: Unknown render mode '{render_mode}'. Using 'process'.")
+        render_mode = 'process'
+    if render_mode == 'worker' and not hasattr(socket, 'AF_UNIX'):
+        print("WARNING: Render mode 'worker' needs UNIX sockets, not available on this system. Using 'process'.")
+        render_mode = 'process'
+
+    # Threads are enough: the workers mostly wait on PHP subprocesses and file I/O,
+    # and subprocess.run releases the GIL while waiting.
+    max_workers = CONFIG_MAX_WORKERS or os.cpu_count() or 1
+
+    temp_dir = tempfile.mkdtemp(prefix='phpstaticrender_')
+    workers: queue.Queue = queue.Queue()
+    worker_list: List[Dict[str, Any]] = []
+    try:
+        # Opcache file cache shared by every PHP process of the build, inside the private
+        # temporary folder (mkdtemp): compiled scripts are reused instead of parsed again
+        opcache_dir = os.path.join(temp_dir, 'opcache')
+        os.mkdir(opcache_dir)
+        php_argv = php_argv_base(php_exec, opcache_dir)
+
+        bootstrap_path = os.path.join(temp_dir, '__bootstrap.php')
+        if render_mode == 'batch' and php_tasks:
+            with open(bootstrap_path, 'w', encoding='utf-8') as f:
+                f.write(BATCH_BOOTSTRAP_PHP)
+
+        worker_path = os.path.join(temp_dir, '__worker.php')
+        if render_mode == 'worker' and php_tasks:
+            with open(worker_path, 'w', encoding='utf-8') as f:
+                f.write(WORKER_PHP)
+
+            # One PHP worker per thread, all started before waiting for any of them
+            for i in range(min(max_workers, len(php_tasks))):
+                socket_path = os.path.join(temp_dir, f'worker{i}.sock')
                 try:
-                    shutil.copy2(src_file_path, dest_file_path)
-                    print(f"[COPY] {rel_path}")
-                    stats['static'] += 1
-                except Exception as ex:
-                    print(f"[COPY ERROR] {rel_path}: {ex}")
-                    stats['errors'] += 1
+                    process = start_php_worker(php_argv, root_dir, worker_path, socket_path)
+                except OSError:
+                    process = None
+                worker_list.append({'process': process, 'socket_path': socket_path})
+            for worker in worker_list:
+                if worker['process'] is not None:
+                    try:
+                        wait_php_worker(worker['process'], worker['socket_path'])
+                    except OSError:
+                        worker['process'] = None
+                workers.put(worker)
+            if not any(worker['process'] is not None for worker in worker_list):
+                print("WARNING: PHP workers failed to start. Rendering one process per file.")
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            if render_mode == 'batch':
+                # One group of files per worker, each rendered by a single PHP process
+                for i in range(min(max_workers, len(php_tasks))):
+                    group = php_tasks[i::max_workers]
+                    future = executor.submit(_render_batch, php_argv, root_dir, group, replacements, bootstrap_path)
+                    futures[future] = ('batch', group)
+            elif render_mode == 'worker':
+                for task in php_tasks:
+                    future = executor.submit(_render_worker, php_argv, root_dir, task, replacements, workers, worker_path)
+                    futures[future] = ('php', task)
+            else:
+                for task in php_tasks:
+                    futures[executor.submit(_render_one, php_argv, root_dir, task, replacements)] = ('php', task)
+            for task in static_tasks:
+                futures[executor.submit(_copy_one, task, hardlink_static)] = ('static', task)
+
+            try:
+                for future in as_completed(futures):
+                    kind, job = futures[future]
+
+                    if kind == 'batch':
+                        results = future.result()
+                    else:
+                        try:
+                            future.result()
+                            results = [(job, None)]
+                        except Exception as ex:
+                            results = [(job, ex)]
+
+                    for task, error in results:
+                        _report(kind, task, error)
+            except KeyboardInterrupt:
+                # Drops pending tasks so the executor shutdown does not wait for them
+                for future in futures:
+                    future.cancel()
+                raise
+    finally:
+        _flush_output()
+        for worker in worker_list:
+            if worker['process'] is not None:
+                worker['process'].kill()
+                worker['process'].wait()
+        shutil.rmtree(temp_dir, ignore_errors=True)
 
     # --- Finalization ---
     print("-" * 60)